@@ -18,13 +18,243 @@ License: MIT
 """
 
 import os
+import argparse
+import asyncio
 import subprocess
+import multiprocessing
+import runpy
+import traceback
 import time
 import sys
 import re
 import shutil
+import hashlib
+import itertools
 import threading
-from typing import List, Tuple, Dict, Optional
+import queue
+import atexit
+import glob
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, List, Tuple, Dict, Optional
+
+try:
+    import uvloop
+except ImportError:  # optional, falls back to the default event loop
+    uvloop = None
+
+try:
+    import yaml
+except ImportError:  # optional, only needed for --config
+    yaml = None
+
+# Directory containing this module; run logs are written below it
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Execution modes accepted from the command line and configuration files:
+# analysis only, transform and build, full pipeline
+_MODES = ('1', '2', '3')
+
+# Default phase inputs, used unless a configuration file overrides them
+DEFAULT_FILE_TYPES = ['source-files', 'config-files', 'data-files', 'metadata']
+DEFAULT_VALIDATE_TYPES = ['source-files', 'config-files', 'data-files']
+DEFAULT_ANALYSIS_TYPES = ['dependencies', 'patterns', 'metrics', 'quality']
+DEFAULT_TRANSFORMATIONS = [
+    ('source-files', 'target-format'),
+    ('config-files', 'target-config'),
+    ('data-files', 'target-schema')
+]
+
+# Upper bound on concurrently running pipeline tools within a single phase
+MAX_PARALLEL_TASKS = 8
+
+# Process creation options for child commands. With close_fds off the child
+# does not walk and close every descriptor before exec (Python creates them
+# non-inheritable, so nothing extra leaks). On Windows, skip allocating a
+# console for each child.
+if sys.platform == 'win32':
+    _SPAWN_OPTIONS = {'creationflags': subprocess.CREATE_NO_WINDOW}
+else:
+    _SPAWN_OPTIONS = {'close_fds': False}
+
+# Log file names carry the process start time and pid, then a sequence number
+# shared by every orchestrator in the process, so neither repeated runs nor
+# concurrent orchestrators writing to one log directory reuse a name
+_LOG_RUN_ID = f"{int(time.time())}-{os.getpid()}"
+_LOG_SEQ = itertools.count()
+
+# Phases whose tool runs are skipped when their inputs are unchanged
+_CACHEABLE_PHASES = ('extract', 'validate')
+
+# Number of artifact copies kept in flight while populating the build target
+COPY_QUEUE_DEPTH = 32
+
+# Bounds for streamed logs (stream_logs=True): chunks waiting for the writer
+# thread, chunks per write call, and bytes read from a child per chunk
+LOG_QUEUE_SIZE = 1024
+LOG_WRITE_BATCH = 32
+_LOG_CHUNK_SIZE = 64 * 1024
+
+# Transformation log row for an artifact with zero errors: | artifact_name | 0 |
+_ARTIFACT_RE = re.compile(rb"\|\s*([^|]+\.\w+)\s*\|\s*0\s*\|")
+
+# Extensions marking a transformation log row as an artifact entry, matched
+# in one pass rather than one substring scan per extension
+_EXT_RE = re.compile(rb"\.(?:src|dat|cfg)")
+
+
+def _run_script_in_worker(script: str, log_file: str, cwd: str,
+                          env: Optional[Dict[str, str]] = None) -> int:
+    """
+    Run a Python pipeline tool inside a pooled worker process.
+    
+    The tool executes as ``__main__`` with stdout/stderr redirected at the
+    file-descriptor level, so output from child processes it spawns is
+    captured in the log as well.
+    
+    Args:
+        script: Path of the tool script, relative to cwd
+        log_file: Log file receiving the tool's combined output
+        cwd: Working directory for the tool
+        env: Environment for the tool; the worker's own if None
+        
+    Returns:
+        Exit code of the tool
+    """
+    saved_cwd, saved_argv, saved_path = os.getcwd(), sys.argv, sys.path[:]
+    saved_environ = dict(os.environ)
+    saved_fds = (os.dup(1), os.dup(2))
+    
+    with open(log_file, 'wb') as log:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        try:
+            if env is not None:
+                os.environ.clear()
+                os.environ.update(env)
+            os.chdir(cwd)
+            sys.argv = [script]
+            sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+            runpy.run_path(script, run_name='__main__')
+            exit_code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            for fd in saved_fds:
+                os.close(fd)
+            os.chdir(saved_cwd)
+            sys.argv, sys.path[:] = saved_argv, saved_path
+            if env is not None:
+                os.environ.clear()
+                os.environ.update(saved_environ)
+    
+    return exit_code
+
+
+def _print_banner(title: str):
+    """Print a section banner with a single write to stdout."""
+    rule = "=" * 60
+    sys.stdout.write(f"\n{rule}\n{title}\n{rule}\n\n")
+
+
+def _stem_lower(name: str) -> str:
+    """Lower-cased file name without its extension, as os.path.splitext splits it."""
+    stem = name.rpartition('.')[0]
+    # Leading dots do not start an extension ('.bashrc', '..foo')
+    return (stem if stem.strip('.') else name).lower()
+
+
+def _write_chunks(fd: int, chunks: List[bytes]):
+    """
+    Write chunks to a file descriptor, with a single writev() where available.
+    
+    Args:
+        fd: File descriptor to write to
+        chunks: Data to write, in order
+    """
+    if hasattr(os, 'writev'):
+        written = os.writev(fd, chunks)
+        if written == sum(map(len, chunks)):
+            return
+        data = b''.join(chunks)[written:]
+    else:
+        data = b''.join(chunks)
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _reset_log_dir(log_dir: str):
+    """
+    Replace log_dir with an empty directory without waiting for the old logs.
+    
+    The previous run's directory is renamed aside, which is a single syscall
+    on the same filesystem, and deleted by a background thread while the
+    pipeline starts. Leftovers from runs that were killed before their
+    cleanup finished are swept up by the same thread.
+    
+    Args:
+        log_dir: Log directory to reset
+    """
+    if os.path.exists(log_dir):
+        try:
+            os.rename(log_dir, f"{log_dir}.old.{os.getpid()}.{int(time.time())}")
+        except OSError:
+            # e.g. a log still open on Windows; fall back to deleting in place
+            shutil.rmtree(log_dir, ignore_errors=True)
+    os.makedirs(log_dir, exist_ok=True)
+    
+    stale = glob.glob(f"{glob.escape(log_dir)}.old.*")
+    if stale:
+        def remove_stale():
+            for path in stale:
+                shutil.rmtree(path, ignore_errors=True)
+        
+        cleanup = threading.Thread(target=remove_stale, name="log-cleanup", daemon=True)
+        cleanup.start()
+        atexit.register(cleanup.join)
+
+
+def _iter_files(root: str, rel_dir: str = '') -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Recursively yield the files below a directory using os.scandir.
+    
+    Like os.walk, symlinked directories are not descended into and
+    unreadable directories are skipped.
+    
+    Args:
+        root: Directory to scan
+        rel_dir: Path of root relative to the top of the scan
+        
+    Yields:
+        Tuples of (directory relative to the top of the scan, file entry)
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry)
+                else:
+                    yield rel_dir, entry
+    except OSError:
+        return
+    
+    for entry in subdirs:
+        yield from _iter_files(entry.path, os.path.join(rel_dir, entry.name))
 
 
 class PipelineOrchestrator:
@@ -33,15 +263,32 @@ class PipelineOrchestrator:
     and progress tracking.
     """
     
-    def __init__(self, project_dir: str):
+    def __init__(self, project_dir: str, reuse_interpreters: bool = False,
+                 use_cache: bool = True, log_dir: Optional[str] = None,
+                 stream_logs: bool = False):
         """
         Initialize the orchestrator.
         
         Args:
             project_dir: Root directory of the project to process
+            reuse_interpreters: Run Python pipeline tools in a persistent pool
+                of worker processes instead of starting a new interpreter
+                for every tool. A pooled tool can only be stopped by
+                terminating the workers, so cancelling one (fail-fast,
+                Ctrl-C) kills every tool in the pool; the pool is recreated
+                on next use
+            use_cache: Skip extraction and validation tools that already
+                succeeded for the same inputs
+            log_dir: Directory for run logs; defaults to runlogs/ next to
+                this module
+            stream_logs: Pipe command output through this process and write
+                all logs from one thread in batches, instead of letting each
+                command write its own log file
         """
         self.project_dir = project_dir
-        self.log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "runlogs")
+        self.log_dir = log_dir or os.path.join(_MODULE_DIR, "runlogs")
+        # Environment for child commands; run() sets it, None inherits ours
+        self.env: Optional[Dict[str, str]] = None
         self.execution_summary = {
             'extract': [],
             'validate': [],
@@ -49,38 +296,380 @@ class PipelineOrchestrator:
             'transform': [],
             'build': []
         }
+        # Stamps of successful extract/validate runs; kept under work/ so
+        # they go away together with the outputs they vouch for
+        self._cache_dir = os.path.join(project_dir, 'work', '.pipeline-cache')
+        self._use_cache = use_cache
+        self._input_fingerprint: Optional[str] = None
+        self._reuse_interpreters = reuse_interpreters
+        self._tool_pool: Optional[ProcessPoolExecutor] = None
+        # Log chunks as (fd, data) tuples; data None closes fd, and a bare
+        # None stops the writer thread
+        self._log_queue: Optional[queue.Queue] = None
+        self._log_writer: Optional[threading.Thread] = None
+        if stream_logs:
+            self._log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+            self._log_writer = threading.Thread(
+                target=self._log_writer_loop, name="log-writer", daemon=True
+            )
+            self._log_writer.start()
     
-    def run_command(self, cmd: str, desc: str, cwd: Optional[str] = None) -> int:
+    def close(self):
+        """Release the worker pool and flush logs still queued for writing."""
+        if self._tool_pool is not None:
+            self._tool_pool.shutdown(wait=True)
+            self._tool_pool = None
+        if self._log_writer is not None:
+            self._log_queue.put(None)
+            self._log_writer.join()
+            self._log_writer = None
+    
+    def _log_writer_loop(self):
+        """Write queued log chunks, batching consecutive chunks for the same file."""
+        while True:
+            batch = [self._log_queue.get()]
+            while len(batch) < LOG_WRITE_BATCH:
+                try:
+                    batch.append(self._log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            pending_fd, pending = None, []
+            for item in batch + [None]:
+                if pending and (item is None or item[0] != pending_fd or item[1] is None):
+                    try:
+                        _write_chunks(pending_fd, pending)
+                    except OSError:
+                        pass  # e.g. disk full; drop the chunk rather than stall the pipeline
+                    pending = []
+                if item is None:
+                    continue
+                fd, data = item
+                if data is None:
+                    os.close(fd)
+                else:
+                    pending_fd = fd
+                    pending.append(data)
+            
+            if None in batch:
+                return
+    
+    def _log_path(self, log_stem: str) -> str:
         """
-        Execute a shell command with logging and error handling.
+        Allocate a unique log file path in the log directory.
         
         Args:
-            cmd: Command to execute
+            log_stem: Prefix of the log file name, usually the tool name
+            
+        Returns:
+            Path of the new log file
+        """
+        os.makedirs(self.log_dir, exist_ok=True)
+        return os.path.join(self.log_dir, f"{log_stem}_{_LOG_RUN_ID}_{next(_LOG_SEQ):06d}.log")
+    
+    async def run_command(self, argv: List[str], desc: str, log_stem: str,
+                          cwd: Optional[str] = None) -> int:
+        """
+        Execute a command with logging and error handling.
+        
+        The command is run directly, without a shell, and its combined
+        stdout/stderr is written to a log file in the log directory. If the
+        caller is cancelled, the command is killed.
+        
+        Args:
+            argv: Command to execute, as an argument list
             desc: Human-readable description for logging
+            log_stem: Prefix of the command's log file name
             cwd: Working directory for command execution
             
         Returns:
             Exit code of the command
         """
-        if cwd is None:
-            cwd = self.project_dir
+        if self._log_queue is not None:
+            return await self._run_streamed(argv, cwd, log_stem)
+        
+        with open(self._log_path(log_stem), 'wb') as log:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *argv, cwd=cwd or self.project_dir, env=self.env,
+                    stdout=log, stderr=asyncio.subprocess.STDOUT, **_SPAWN_OPTIONS
+                )
+            except OSError as e:
+                # Report a missing executable the way a shell would
+                log.write(f"{argv[0]}: {e}\n".encode())
+                return 127
+        
+        return await self._wait_process(proc)
+    
+    async def _run_streamed(self, argv: List[str], cwd: Optional[str],
+                            log_stem: str) -> int:
+        """
+        Execute a command, passing its output to the log writer thread.
+        
+        Args:
+            argv: Command to execute, as an argument list
+            cwd: Working directory for command execution
+            log_stem: Prefix of the command's log file name
             
-        os.makedirs(self.log_dir, exist_ok=True)
+        Returns:
+            Exit code of the command
+        """
+        fd = os.open(self._log_path(log_stem), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv, cwd=cwd or self.project_dir, env=self.env,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+                **_SPAWN_OPTIONS
+            )
+        except OSError as e:
+            os.write(fd, f"{argv[0]}: {e}\n".encode())
+            os.close(fd)
+            return 127
         
-        # Generate unique log file with timestamp
-        script_name = cmd.split()[2] if len(cmd.split()) > 2 else cmd.replace(' ', '_')
-        script_name = os.path.basename(script_name)
-        log_file = os.path.join(
-            self.log_dir, 
-            f"{os.path.splitext(script_name)[0]}_{int(time.time())}.log"
-        )
+        # The pump is not cancelled with this command: asyncio only reports
+        # the exit once stdout is closed, so it must keep reading until the
+        # killed child's pipe reaches EOF
+        pump = asyncio.ensure_future(self._pump_log(proc.stdout, fd))
+        try:
+            return await self._wait_process(proc)
+        finally:
+            await asyncio.shield(pump)
+    
+    async def _pump_log(self, stream: asyncio.StreamReader, fd: int):
+        """
+        Queue a child's output for the log writer thread, then close the log.
         
-        full_cmd = f"{cmd} > \"{log_file}\" 2>&1"
-        exit_code = subprocess.call(full_cmd, shell=True, cwd=cwd)
+        Args:
+            stream: Child's stdout
+            fd: Log file descriptor, owned by the writer thread from here on
+        """
+        pending = None
+        try:
+            while True:
+                chunk = await stream.read(_LOG_CHUNK_SIZE)
+                if not chunk:
+                    break
+                pending = self._queue_log((fd, chunk))
+                if pending is not None:
+                    # Shielded: a put running in the executor cannot be
+                    # cancelled, so its future must stay pending until the
+                    # chunk is actually queued
+                    await asyncio.shield(pending)
+                    pending = None
+        finally:
+            # The close marker must follow the last chunk, or the writer
+            # would write it after closing fd
+            if pending is not None:
+                await asyncio.shield(pending)
+            marker = self._queue_log((fd, None))
+            if marker is not None:
+                await asyncio.shield(marker)
+    
+    def _queue_log(self, item: Tuple[int, Optional[bytes]]) -> Optional[asyncio.Future]:
+        """
+        Queue an item for the log writer thread without blocking the event loop.
+        
+        Args:
+            item: (fd, data) tuple; data None closes fd
+            
+        Returns:
+            None if the item was queued at once, otherwise the future of a
+            put waiting for space in the default executor
+        """
+        try:
+            self._log_queue.put_nowait(item)
+            return None
+        except queue.Full:
+            return asyncio.get_running_loop().run_in_executor(None, self._log_queue.put, item)
+    
+    async def _run_pipeline_tool(self, tool: str, desc: str) -> int:
+        """
+        Run tools/pipeline/<tool>.py from the project directory.
+        
+        Args:
+            tool: Name of the tool script without extension, e.g. extract-metadata
+            desc: Human-readable description for logging
+            
+        Returns:
+            Exit code of the tool
+        """
+        script = f"tools/pipeline/{tool}.py"
+        if self._reuse_interpreters:
+            return await self._run_tool(script, self._log_path(tool), self.project_dir)
+        return await self.run_command(["python", script], desc, log_stem=tool)
+    
+    @staticmethod
+    async def _wait_process(proc: asyncio.subprocess.Process) -> int:
+        """
+        Wait for a child process, killing it if the wait is cancelled.
+        
+        Args:
+            proc: Child process started by asyncio
+            
+        Returns:
+            Exit code of the process
+        """
+        try:
+            return await proc.wait()
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.kill()
+                await asyncio.shield(proc.wait())
+            raise
+    
+    async def _run_tool(self, script: str, log_file: str, cwd: str) -> int:
+        """
+        Run a Python pipeline tool in the persistent worker pool.
+        
+        Args:
+            script: Path of the tool script, relative to cwd
+            log_file: Log file receiving the tool's combined output
+            cwd: Working directory for the tool
+            
+        Returns:
+            Exit code of the tool
+        """
+        if self._tool_pool is None:
+            # Workers are spawned on demand; 'spawn' keeps them independent
+            # of the event loop and threads running in this process
+            self._tool_pool = ProcessPoolExecutor(
+                max_workers=MAX_PARALLEL_TASKS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        pool = self._tool_pool
+        try:
+            future = pool.submit(_run_script_in_worker, script, log_file, cwd, self.env)
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if self._tool_pool is pool:
+                self._terminate_tool_pool()
+            raise
+        except BrokenProcessPool:
+            # A worker died, e.g. a tool called os._exit() or the pool was
+            # terminated; the executor then stops every worker, so this tool
+            # did not finish either. The next tool gets a fresh pool.
+            if self._tool_pool is pool:
+                self._terminate_tool_pool()
+            with open(log_file, 'a') as log:
+                log.write(f"{script}: worker process exited abruptly\n")
+            return 1
+    
+    def _terminate_tool_pool(self):
+        """Shut down the worker pool at once, killing the tools still running."""
+        pool, self._tool_pool = self._tool_pool, None
+        if pool is None:
+            return
+        # Cancelling a future does not stop a tool that has already started
+        # in a worker, so the workers themselves are terminated
+        workers = list((getattr(pool, '_processes', None) or {}).values())
+        if sys.version_info >= (3, 9):
+            pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            pool.shutdown(wait=False)
+        for worker in workers:
+            worker.terminate()
+    
+    def _fingerprint_inputs(self) -> str:
+        """
+        Fingerprint the inputs of the cacheable tools.
+        
+        The fingerprint covers the relative path, modification time and size
+        of every file in the delivery snapshot and the pipeline tools, plus
+        the snapshot and application names. Content is not hashed.
+        
+        Returns:
+            Hex digest of the inputs
+        """
+        env = os.environ if self.env is None else self.env
+        delivery_dir = env.get('DELIVERY_DIR', 'deliveries')
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{delivery_dir}|{env.get('SNAPSHOT_NAME', '')}|"
+                      f"{env.get('APP_NAME', '')}".encode())
+        for input_dir in (delivery_dir, os.path.join('tools', 'pipeline')):
+            records = []
+            for rel_dir, entry in _iter_files(os.path.join(self.project_dir, input_dir)):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    # Dangling symlink, or a file removed during the walk
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                records.append(f"{rel_dir}/{entry.name}\0{st.st_mtime_ns}\0{st.st_size}")
+            # Sorted, so the key does not depend on directory listing order
+            records.sort()
+            digest.update(f"\n{input_dir}\n".encode())
+            digest.update("\n".join(records).encode('utf-8', 'surrogateescape'))
+        return digest.hexdigest()
+    
+    async def _prepare_cache(self):
+        """Fingerprint the inputs in a thread, keeping the event loop responsive."""
+        if self._use_cache and self._input_fingerprint is None:
+            self._input_fingerprint = await asyncio.get_running_loop().run_in_executor(
+                None, self._fingerprint_inputs
+            )
+    
+    def _cache_key(self, tool: str) -> str:
+        """
+        Key identifying a tool run on the current inputs.
+        
+        Inputs are fingerprinted once per orchestrator; see _fingerprint_inputs.
+        
+        Args:
+            tool: Name of the tool script without extension
+            
+        Returns:
+            Hex digest of the tool name and input fingerprint
+        """
+        if self._input_fingerprint is None:
+            self._input_fingerprint = self._fingerprint_inputs()
+        
+        return hashlib.blake2b(f"{tool}|{self._input_fingerprint}".encode(),
+                               digest_size=8).hexdigest()
+    
+    async def _run_phase_tool(self, phase: str, item: str, desc: str) -> Tuple[int, bool]:
+        """
+        Run a phase's tool for one item, unless a cached run is still valid.
         
-        return exit_code
+        Args:
+            phase: Phase name, used as the tool prefix
+            item: Item to run the tool for, e.g. a file type
+            desc: Human-readable description for logging
+            
+        Returns:
+            Tuple of (exit code, whether the run was skipped as cached)
+        """
+        tool = f"{phase}-{item}"
+        # One stamp per tool, holding the key of its last successful run
+        stamp = os.path.join(self._cache_dir, f"{tool}.done")
+        key = None
+        if phase in _CACHEABLE_PHASES:
+            if self._use_cache:
+                key = self._cache_key(tool)
+                try:
+                    with open(stamp) as f:
+                        if f.read() == key:
+                            return 0, True
+                except OSError:
+                    pass
+            # The tool is about to rewrite its outputs; until it succeeds, no
+            # earlier run of it, or of a later phase consuming those outputs,
+            # may vouch for them, even with caching off
+            for later in _CACHEABLE_PHASES[_CACHEABLE_PHASES.index(phase):]:
+                try:
+                    os.unlink(os.path.join(self._cache_dir, f"{later}-{item}.done"))
+                except FileNotFoundError:
+                    pass
+        
+        rc = await self._run_pipeline_tool(tool, desc)
+        if rc == 0 and key is not None:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(stamp, 'w') as f:
+                f.write(key)
+        return rc, False
     
-    def extract_phase(self, file_types: List[str]) -> bool:
+    async def extract_phase(self, file_types: List[str]) -> bool:
         """
         Execute extraction phase to obtain source files.
         
@@ -90,26 +679,15 @@ class PipelineOrchestrator:
         Returns:
             True if all extractions succeed, False otherwise
         """
-        print("\n" + "="*60)
-        print("PHASE 1: EXTRACTION")
-        print("="*60 + "\n")
+        _print_banner("PHASE 1: EXTRACTION")
         
-        for file_type in file_types:
-            desc = f"Extracting {file_type}"
-            cmd = f"python tools/pipeline/extract-{file_type}.py"
-            
-            rc = self.run_command(cmd, desc)
-            if rc != 0:
-                print(f"❌ {desc} failed.")
-                return False
-            
-            self.execution_summary['extract'].append(file_type)
-            print(f"✓ {desc} completed")
+        if not await self._run_parallel('extract', 'Extracting', file_types):
+            return False
         
         self._print_phase_summary('extract', 'Extraction')
         return True
     
-    def validate_phase(self, file_types: List[str]) -> bool:
+    async def validate_phase(self, file_types: List[str]) -> bool:
         """
         Execute validation phase to clean and validate extracted files.
         
@@ -119,26 +697,15 @@ class PipelineOrchestrator:
         Returns:
             True if all validations succeed, False otherwise
         """
-        print("\n" + "="*60)
-        print("PHASE 2: VALIDATION")
-        print("="*60 + "\n")
+        _print_banner("PHASE 2: VALIDATION")
         
-        for file_type in file_types:
-            desc = f"Validating {file_type}"
-            cmd = f"python tools/pipeline/validate-{file_type}.py"
-            
-            rc = self.run_command(cmd, desc)
-            if rc != 0:
-                print(f"❌ {desc} failed.")
-                return False
-            
-            self.execution_summary['validate'].append(file_type)
-            print(f"✓ {desc} completed")
+        if not await self._run_parallel('validate', 'Validating', file_types):
+            return False
         
         self._print_phase_summary('validate', 'Validation')
         return True
     
-    def analyze_phase(self, analysis_types: List[str]) -> bool:
+    async def analyze_phase(self, analysis_types: List[str]) -> bool:
         """
         Execute analysis phase to analyze dependencies and patterns.
         
@@ -148,26 +715,184 @@ class PipelineOrchestrator:
         Returns:
             True if all analyses succeed, False otherwise
         """
-        print("\n" + "="*60)
-        print("PHASE 3: ANALYSIS")
-        print("="*60 + "\n")
+        _print_banner("PHASE 3: ANALYSIS")
         
-        for analysis_type in analysis_types:
-            desc = f"Analyzing {analysis_type}"
-            cmd = f"python tools/pipeline/analyze-{analysis_type}.py"
+        if not await self._run_parallel('analyze', 'Analyzing', analysis_types):
+            return False
+        
+        self._print_phase_summary('analyze', 'Analysis')
+        return True
+    
+    async def _run_parallel(self, phase: str, verb: str, items: List[str]) -> bool:
+        """
+        Run a phase's independent pipeline tools concurrently.
+        
+        Args:
+            phase: Phase name, used as the tool prefix and execution summary key
+            verb: Verb used in progress messages
+            items: Items to run the phase's tool for, e.g. file types
             
-            rc = self.run_command(cmd, desc)
-            if rc != 0:
-                print(f"❌ {desc} failed.")
-                return False
+        Returns:
+            True if all tools succeed, False on the first failure
+        """
+        if phase in _CACHEABLE_PHASES:
+            await self._prepare_cache()
+        slots = asyncio.Semaphore(MAX_PARALLEL_TASKS)
+        
+        async def run(item: str) -> Tuple[Tuple[int, bool], str, str]:
+            desc = f"{verb} {item}"
+            async with slots:
+                return await self._run_phase_tool(phase, item, desc), desc, item
+        
+        completed = set()
+        pending = [asyncio.ensure_future(run(item)) for item in items]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                (rc, cached), desc, item = await next_done
+                if rc != 0:
+                    print(f"❌ {desc} failed.")
+                    return False
+                
+                completed.add(item)
+                print(f"✓ {desc} {'skipped, inputs unchanged' if cached else 'completed'}")
+        finally:
+            # Fail fast: stop tools still running after a failure or cancellation
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self._record_completed(phase, items, completed)
+        
+        return True
+    
+    async def run_pipeline(self, file_types: List[str], validate_types: List[str],
+                           analysis_types: List[str]) -> bool:
+        """
+        Execute extraction, validation and analysis as overlapping stages.
+        
+        Each file type moves on to validation as soon as its own extraction
+        finishes instead of waiting for the whole extraction phase. Analyses
+        span all file types, so they start once every validation is done.
+        
+        Args:
+            file_types: List of file types to extract
+            validate_types: List of file types to validate; types that are
+                also extracted are validated after their extraction
+            analysis_types: List of analysis types to perform (may be empty)
             
-            self.execution_summary['analyze'].append(analysis_type)
-            print(f"✓ {desc} completed")
+        Returns:
+            True if every stage succeeds, False otherwise
+        """
+        phases = ['EXTRACTION', 'VALIDATION'] + (['ANALYSIS'] if analysis_types else [])
+        _print_banner(f"PHASES 1-{len(phases)}: {' → '.join(phases)}")
         
-        self._print_phase_summary('analyze', 'Analysis')
+        await self._prepare_cache()
+        failed = asyncio.Event()
+        to_extract, to_validate, to_analyze = asyncio.Queue(), asyncio.Queue(), asyncio.Queue()
+        
+        stages = [
+            ('extract', 'Extracting', to_extract, to_validate, file_types),
+            ('validate', 'Validating', to_validate, None, validate_types),
+            ('analyze', 'Analyzing', to_analyze, None, analysis_types),
+        ]
+        completed = {phase: set() for phase, *_ in stages}
+        
+        workers = [
+            [
+                asyncio.ensure_future(self._stage_worker(
+                    phase, verb, q_in, q_out, set(items), completed[phase], failed
+                ))
+                for _ in range(max(1, min(len(items), MAX_PARALLEL_TASKS)))
+            ]
+            for phase, verb, q_in, q_out, items in stages
+        ]
+        
+        async def drain(q_in: asyncio.Queue, stage_workers: List[asyncio.Future]):
+            # One sentinel per worker flushes the stage once its input is final
+            for _ in stage_workers:
+                q_in.put_nowait(None)
+            await asyncio.gather(*stage_workers)
+        
+        extract_workers, validate_workers, analyze_workers = workers
+        
+        async def feed():
+            for file_type in file_types:
+                to_extract.put_nowait(file_type)
+            # Types not extracted in this run have nothing to wait for
+            extracted = set(file_types)
+            for file_type in validate_types:
+                if file_type not in extracted:
+                    to_validate.put_nowait(file_type)
+            await drain(to_extract, extract_workers)
+            await drain(to_validate, validate_workers)
+            
+            for analysis_type in analysis_types:
+                to_analyze.put_nowait(analysis_type)
+            await drain(to_analyze, analyze_workers)
+        
+        feeder = asyncio.ensure_future(feed())
+        failure = asyncio.ensure_future(failed.wait())
+        tasks = [feeder, failure] + extract_workers + validate_workers + analyze_workers
+        try:
+            await asyncio.wait([feeder, failure], return_when=asyncio.FIRST_COMPLETED)
+            if not failed.is_set():
+                feeder.result()
+        finally:
+            # Fail fast: stop tools still running after a failure or cancellation
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for phase, _, _, _, items in stages:
+                self._record_completed(phase, items, completed[phase])
+        
+        if failed.is_set():
+            return False
+        
+        self._print_phase_summary('extract', 'Extraction')
+        self._print_phase_summary('validate', 'Validation')
+        if analysis_types:
+            self._print_phase_summary('analyze', 'Analysis')
         return True
     
-    def transform_phase(self, transformations: List[Tuple[str, str]]) -> bool:
+    async def _stage_worker(self, phase: str, verb: str, q_in: asyncio.Queue,
+                            q_out: Optional[asyncio.Queue], accepted: set,
+                            completed: set, failed: asyncio.Event):
+        """
+        Run pipeline tools for items taken from a stage's input queue.
+        
+        Items this stage does not handle are passed through untouched. A
+        failure sets failed, on which run_pipeline cancels every worker and
+        so kills the tools still running.
+        
+        Args:
+            phase: Phase name, used for the tool prefix and execution summary
+            verb: Verb used in progress messages
+            q_in: Queue of items for this stage, terminated by None
+            q_out: Queue feeding the next stage, if any
+            accepted: Items this stage runs a tool for
+            completed: Receives the items whose tool succeeded
+            failed: Event shared by all stages, set on the first failure
+        """
+        while True:
+            item = await q_in.get()
+            if item is None:
+                return
+            if failed.is_set():
+                continue
+            
+            if item in accepted:
+                desc = f"{verb} {item}"
+                rc, cached = await self._run_phase_tool(phase, item, desc)
+                if rc != 0:
+                    failed.set()
+                    print(f"❌ {desc} failed.")
+                    continue
+                completed.add(item)
+                print(f"✓ {desc} {'skipped, inputs unchanged' if cached else 'completed'}")
+            
+            if q_out is not None:
+                q_out.put_nowait(item)
+    
+    async def transform_phase(self, transformations: List[Tuple[str, str]]) -> bool:
         """
         Execute transformation phase to convert files to target format.
         
@@ -177,15 +902,11 @@ class PipelineOrchestrator:
         Returns:
             True if all transformations succeed, False otherwise
         """
-        print("\n" + "="*60)
-        print("PHASE 4: TRANSFORMATION")
-        print("="*60 + "\n")
+        _print_banner("PHASE 4: TRANSFORMATION")
         
         for source, target in transformations:
             desc = f"Transforming {source} to {target}"
-            cmd = f"python tools/pipeline/transform-{source}-to-{target}.py"
-            
-            rc = self.run_command(cmd, desc)
+            rc = await self._run_pipeline_tool(f"transform-{source}-to-{target}", desc)
             if rc != 0:
                 print(f"❌ {desc} failed.")
                 return False
@@ -196,7 +917,7 @@ class PipelineOrchestrator:
         self._print_phase_summary('transform', 'Transformation')
         return True
     
-    def build_phase(self, build_tool: str = "ant") -> Tuple[bool, Dict]:
+    async def build_phase(self, build_tool: str = "ant") -> Tuple[bool, Dict]:
         """
         Execute build phase to compile and package artifacts.
         
@@ -206,46 +927,59 @@ class PipelineOrchestrator:
         Returns:
             Tuple of (success status, metrics dictionary)
         """
-        print("\n" + "="*60)
-        print("PHASE 5: BUILD")
-        print("="*60 + "\n")
+        _print_banner("PHASE 5: BUILD")
+        
+        # File work runs in a thread so other orchestrators on the event
+        # loop keep reaping and draining their children meanwhile
+        loop = asyncio.get_running_loop()
         
         # Parse transformation logs to identify successful transformations
-        successful_artifacts = self._identify_successful_artifacts()
+        successful_artifacts, total_artifacts = await loop.run_in_executor(
+            None, self._scan_transformation_log
+        )
         
         # Copy successful artifacts to target directory
-        copied_count = self._copy_artifacts(successful_artifacts)
+        copied_count = await loop.run_in_executor(
+            None, self._copy_artifacts, successful_artifacts
+        )
         
         # Execute build process
-        build_success = self._execute_build(build_tool)
+        build_success = await self._execute_build(build_tool)
         
         # Calculate metrics
-        metrics = self._calculate_metrics(successful_artifacts, copied_count)
+        metrics = self._calculate_metrics(successful_artifacts, copied_count, total_artifacts)
         
         return build_success, metrics
     
-    def _identify_successful_artifacts(self) -> List[str]:
+    def _scan_transformation_log(self) -> Tuple[List[str], int]:
         """
-        Parse transformation logs to identify artifacts with zero errors.
+        Parse the transformation log in a single pass.
         
         Returns:
-            List of successfully transformed artifact names
+            Tuple of (names of artifacts transformed with zero errors,
+            total number of artifact entries in the log)
         """
         log_file = os.path.join(self.project_dir, 'logs', 'transformation.log')
         if not os.path.exists(log_file):
-            return []
+            return [], 0
         
         successful = []
-        # Pattern to match: | artifact_name | 0 | (indicating zero errors)
-        pattern = re.compile(r"\|\s*([^|]+\.\w+)\s*\|\s*0\s*\|")
+        total_artifacts = 0
+        search = _ARTIFACT_RE.search
+        is_artifact = _EXT_RE.search
         
-        with open(log_file) as f:
+        with open(log_file, 'rb') as f:
             for line in f:
-                match = pattern.search(line)
+                # Both artifact entries and zero-error rows are table rows
+                if b'|' not in line:
+                    continue
+                if is_artifact(line):
+                    total_artifacts += 1
+                match = search(line)
                 if match:
-                    successful.append(match.group(1))
+                    successful.append(match.group(1).decode('utf-8', 'replace'))
         
-        return successful
+        return successful, total_artifacts
     
     def _copy_artifacts(self, successful_artifacts: List[str]) -> int:
         """
@@ -269,25 +1003,56 @@ class PipelineOrchestrator:
             for x in successful_artifacts
         }
         
-        copied_count = 0
-        for root, _, files in os.walk(src_dir):
-            rel_path = os.path.relpath(root, src_dir)
-            dest_dir = os.path.join(tgt_dir, rel_path)
-            os.makedirs(dest_dir, exist_ok=True)
-            
-            for file in files:
-                basename = os.path.splitext(file)[0].lower()
-                if basename in successful_basenames:
-                    shutil.copy(
-                        os.path.join(root, file), 
-                        os.path.join(dest_dir, file)
-                    )
-                    copied_count += 1
+        # Collect the copies first so destination directories are created
+        # in one pass instead of interleaving mkdir calls with the copies
+        copies = []
+        dest_dirs = set()
+        # Per-file work is plain string handling on locals; this loop sees
+        # every file under the transformed tree, and most of them are not
+        # successful artifacts, so the stem is cut with one rfind and slice
+        stem_lower = _stem_lower
+        is_successful = successful_basenames.__contains__
+        sep = os.sep
+        for rel_dir, entry in _iter_files(src_dir):
+            name = entry.name
+            name_lower = name.lower()
+            dot = name_lower.rfind('.')
+            if dot > 0 and name_lower[0] != '.':
+                stem = name_lower[:dot]
+            else:
+                # No extension, or leading dots that splitext does not count
+                stem = stem_lower(name_lower)
+            if is_successful(stem):
+                dest_dir = f"{tgt_dir}{sep}{rel_dir}" if rel_dir else tgt_dir
+                dest_dirs.add(dest_dir)
+                copies.append((entry.path, f"{dest_dir}{sep}{name}"))
+        
+        # Parents sort before their children, so a directory whose parent
+        # was just created needs a single mkdir rather than makedirs' walk
+        created = {tgt_dir}
+        for dest_dir in sorted(dest_dirs):
+            if dest_dir in created:
+                continue
+            if os.path.dirname(dest_dir) in created:
+                try:
+                    os.mkdir(dest_dir)
+                except FileExistsError:
+                    pass
+            else:
+                os.makedirs(dest_dir, exist_ok=True)
+            created.add(dest_dir)
+        
+        # shutil.copy releases the GIL inside the kernel copy, so a thread
+        # pool keeps several copies queued on the device at once
+        with ThreadPoolExecutor(max_workers=COPY_QUEUE_DEPTH) as pool:
+            for _ in pool.map(lambda pair: shutil.copy(*pair), copies):
+                pass
+        copied_count = len(copies)
         
         print(f"✓ Copied {copied_count} validated artifacts\n")
         return copied_count
     
-    def _execute_build(self, build_tool: str) -> bool:
+    async def _execute_build(self, build_tool: str) -> bool:
         """
         Execute build process using specified build tool.
         
@@ -297,7 +1062,8 @@ class PipelineOrchestrator:
         Returns:
             True if build succeeds, False otherwise
         """
-        build_exec = shutil.which(build_tool)
+        env = os.environ if self.env is None else self.env
+        build_exec = shutil.which(build_tool, path=env.get('PATH'))
         if not build_exec:
             print(f"⚠ {build_tool} not found, skipping build step.")
             return False
@@ -307,12 +1073,8 @@ class PipelineOrchestrator:
         print(f"Building artifacts using {build_tool.upper()}...\n")
         
         for target in ['clean', 'build', 'install']:
-            cmd = f'{build_exec} {target}'
-            log_name = f'{build_tool}_{target}_{int(time.time())}.log'
-            log_file = os.path.join(self.log_dir, log_name)
-            
-            full_cmd = f'{cmd} > "{log_file}" 2>&1'
-            rc = subprocess.call(full_cmd, shell=True, cwd=tgt_dir)
+            rc = await self.run_command([build_exec, target], f"{build_tool} {target}",
+                                        log_stem=f'{build_tool}_{target}', cwd=tgt_dir)
             
             status = "✓" if rc == 0 else "❌"
             print(f"{status} {build_tool} {target}")
@@ -324,26 +1086,22 @@ class PipelineOrchestrator:
         return True
     
     def _calculate_metrics(self, successful_artifacts: List[str], 
-                          copied_count: int) -> Dict:
+                          copied_count: int,
+                          total_artifacts: Optional[int] = None) -> Dict:
         """
         Calculate pipeline success metrics.
         
         Args:
             successful_artifacts: List of successful artifact names
             copied_count: Number of files copied
+            total_artifacts: Number of artifacts in the transformation log;
+                the log is scanned when not given
             
         Returns:
             Dictionary containing metrics
         """
-        # Count total artifacts processed
-        log_file = os.path.join(self.project_dir, 'logs', 'transformation.log')
-        total_artifacts = 0
-        
-        if os.path.exists(log_file):
-            with open(log_file) as f:
-                for line in f:
-                    if '|' in line and any(ext in line for ext in ['.src', '.dat', '.cfg']):
-                        total_artifacts += 1
+        if total_artifacts is None:
+            _, total_artifacts = self._scan_transformation_log()
         
         # Calculate success rates
         transform_rate = (len(successful_artifacts) / total_artifacts * 100) if total_artifacts else 0
@@ -357,15 +1115,28 @@ class PipelineOrchestrator:
             'build_success_rate': build_rate
         }
     
+    def _record_completed(self, phase: str, items: List[str], completed: set):
+        """
+        Add a phase's successful items to the execution summary in input order.
+        
+        Tools finish in whatever order they happen to, so results are
+        collected first and recorded here, keeping summaries stable.
+        
+        Args:
+            phase: Execution summary key
+            items: Items the phase was run for, in the requested order
+            completed: Items whose tool succeeded
+        """
+        self.execution_summary[phase].extend(item for item in items if item in completed)
+    
     def _print_phase_summary(self, phase: str, phase_name: str):
         """Print summary of completed phase."""
         items = self.execution_summary[phase]
         if items:
-            print(f"\n{phase_name} Summary:")
-            print("-" * 40)
-            for idx, item in enumerate(items, 1):
-                print(f"  {idx}. {item}")
-            print()
+            lines = [f"\n{phase_name} Summary:\n", "-" * 40 + "\n"]
+            lines.extend(f"  {idx}. {item}\n" for idx, item in enumerate(items, 1))
+            lines.append("\n")
+            sys.stdout.write("".join(lines))
     
     def print_final_metrics(self, metrics: Dict):
         """
@@ -374,36 +1145,195 @@ class PipelineOrchestrator:
         Args:
             metrics: Dictionary containing pipeline metrics
         """
-        print("\n" + "="*60)
-        print("PIPELINE EXECUTION SUMMARY")
-        print("="*60 + "\n")
+        _print_banner("PIPELINE EXECUTION SUMMARY")
         
-        print(f"Total Artifacts Processed:    {metrics['total_artifacts']}")
-        print(f"Successful Transformations:   {metrics['successful_transforms']}")
-        print(f"Artifacts Built:              {metrics['copied_artifacts']}")
-        print(f"\nTransformation Success Rate:  {metrics['transform_success_rate']:.2f}%")
-        print(f"Build Success Rate:           {metrics['build_success_rate']:.2f}%")
-        print("\n" + "="*60 + "\n")
+        sys.stdout.write(
+            f"Total Artifacts Processed:    {metrics['total_artifacts']}\n"
+            f"Successful Transformations:   {metrics['successful_transforms']}\n"
+            f"Artifacts Built:              {metrics['copied_artifacts']}\n"
+            f"\nTransformation Success Rate:  {metrics['transform_success_rate']:.2f}%\n"
+            f"Build Success Rate:           {metrics['build_success_rate']:.2f}%\n"
+            f"\n{'=' * 60}\n\n"
+        )
+    
+    async def run(self, mode: str, snapshot: str = 'snapshot-1', app_name: str = '',
+                  build_tool: str = 'ant',
+                  file_types: Optional[List[str]] = None,
+                  validate_types: Optional[List[str]] = None,
+                  analysis_types: Optional[List[str]] = None,
+                  transformations: Optional[List[Tuple[str, str]]] = None) -> int:
+        """
+        Execute the phases of an execution mode.
+        
+        The snapshot and application name reach the pipeline tools through
+        their environment rather than this process's, so orchestrators for
+        different projects can run concurrently, e.g. under asyncio.gather(),
+        provided each has its own log directory.
+        
+        Args:
+            mode: Execution mode ('1' analysis only, '2' transform and build,
+                '3' full pipeline)
+            snapshot: Delivery snapshot to process
+            app_name: Application name passed to the pipeline tools
+            build_tool: Build tool used by the build phase
+            file_types: File types to extract (default: DEFAULT_FILE_TYPES)
+            validate_types: File types to validate (default: DEFAULT_VALIDATE_TYPES)
+            analysis_types: Analyses to perform (default: DEFAULT_ANALYSIS_TYPES)
+            transformations: (source_type, target_type) tuples to transform
+                (default: DEFAULT_TRANSFORMATIONS)
+            
+        Returns:
+            Process exit code: 0 on success, 1 if a phase failed
+        """
+        file_types = DEFAULT_FILE_TYPES if file_types is None else file_types
+        validate_types = DEFAULT_VALIDATE_TYPES if validate_types is None else validate_types
+        analysis_types = DEFAULT_ANALYSIS_TYPES if analysis_types is None else analysis_types
+        if transformations is None:
+            transformations = DEFAULT_TRANSFORMATIONS
+        
+        self.env = dict(os.environ, DELIVERY_DIR=f"deliveries/{snapshot}",
+                        SNAPSHOT_NAME=snapshot, APP_NAME=app_name)
+        self._input_fingerprint = None
+        
+        start_time = time.time()
+        
+        if mode in ('1', '3'):
+            # Analysis workflow
+            if not await self.run_pipeline(file_types, validate_types, analysis_types):
+                return 1
+            
+            if mode == '1':
+                print("✓ Analysis complete.")
+                elapsed = time.time() - start_time
+                print(f"\nTotal execution time: {elapsed:.2f} seconds")
+                return 0
+        
+        if mode in ('2', '3'):
+            # Transform and build workflow
+            if mode == '2':
+                # Need to run extract and validate for mode 2
+                if not await self.run_pipeline(file_types, validate_types, []):
+                    return 1
+            
+            # Transformation phase
+            if not await self.transform_phase(transformations):
+                return 1
+            
+            # Build phase
+            build_success, metrics = await self.build_phase(build_tool=build_tool)
+            
+            # Print metrics
+            self.print_final_metrics(metrics)
+            
+            if build_success:
+                print("✓ Pipeline completed successfully")
+            else:
+                print("⚠ Pipeline completed with warnings")
+        
+        elapsed = time.time() - start_time
+        print(f"Total execution time: {elapsed:.2f} seconds\n")
+        return 0
+
+
+def load_config(config_file: str) -> Dict:
+    """
+    Load pipeline configuration from a YAML file.
+    
+    Args:
+        config_file: Path of the configuration file
+        
+    Returns:
+        Parsed configuration (empty for an empty file)
+    """
+    if yaml is None:
+        raise RuntimeError("PyYAML is required for --config (pip install pyyaml)")
+    with open(config_file) as f:
+        return yaml.safe_load(f) or {}
+
+
+def _settings_from_config(config: Dict) -> Dict:
+    """
+    Map a configuration in the layout of pipeline_config.yaml onto run settings.
+    
+    Args:
+        config: Parsed configuration
+        
+    Returns:
+        Dictionary of the settings the configuration provides
+    """
+    defaults = config.get('pipeline', {}).get('defaults', {})
+    phases = config.get('phases', {})
+    settings = {
+        'project_dir': config.get('project_dir'),
+        'app_name': config.get('app_name'),
+        'mode': str(config['mode']) if config.get('mode') is not None else None,
+        'snapshot': defaults.get('snapshot'),
+        'build_tool': phases.get('build', {}).get('build_tool', defaults.get('build_tool')),
+        'file_types': phases.get('extract', {}).get('file_types'),
+        'validate_types': phases.get('validate', {}).get('file_types'),
+        'analysis_types': phases.get('analyze', {}).get('analysis_types'),
+    }
+    transformations = phases.get('transform', {}).get('transformations')
+    if transformations is not None:
+        settings['transformations'] = [(t['source'], t['target']) for t in transformations]
+    return {key: value for key, value in settings.items() if value is not None}
 
 
 def main():
-    """Main orchestration workflow with interactive mode selection."""
+    """
+    Main orchestration workflow.
+    
+    Settings come from command-line arguments, then the configuration file,
+    then interactive prompts when stdin is a terminal.
+    """
+    parser = argparse.ArgumentParser(description="Multi-phase pipeline orchestrator")
+    parser.add_argument('--project-dir', help="root directory of the project to process")
+    parser.add_argument('--snapshot', help="delivery snapshot to process (default: snapshot-1)")
+    parser.add_argument('--app-name', help="application name passed to the pipeline tools")
+    parser.add_argument('--mode', choices=_MODES,
+                        help="1: analysis only, 2: transform and build, 3: full pipeline")
+    parser.add_argument('--build-tool', help="build tool for the build phase (default: ant)")
+    parser.add_argument('--config', help="YAML configuration file, e.g. pipeline_config.yaml")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="re-run extraction and validation even if inputs are unchanged")
+    parser.add_argument('--reuse-interpreters', action='store_true',
+                        help="run Python pipeline tools in a persistent worker pool")
+    parser.add_argument('--stream-logs', action='store_true',
+                        help="write all command logs from a single batching writer thread")
+    args = parser.parse_args()
     
-    print("\n" + "="*60)
-    print("PIPELINE ORCHESTRATOR")
-    print("="*60 + "\n")
+    settings = {}
+    if args.config:
+        try:
+            settings = _settings_from_config(load_config(args.config))
+        except Exception as e:
+            parser.error(f"cannot load configuration '{args.config}': {e}")
+        if settings.get('mode', _MODES[0]) not in _MODES:
+            parser.error(f"invalid mode {settings['mode']!r} in '{args.config}' "
+                         f"(choose from {', '.join(_MODES)})")
+    for key in ('project_dir', 'snapshot', 'app_name', 'mode', 'build_tool'):
+        if getattr(args, key) is not None:
+            settings[key] = getattr(args, key)
+    interactive = sys.stdin.isatty()
+    
+    _print_banner("PIPELINE ORCHESTRATOR")
     
     # Get project directory
-    project_dir = input("Enter project directory path: ").strip()
-    print()
+    project_dir = settings.get('project_dir')
+    if not project_dir:
+        if not interactive:
+            parser.error("--project-dir is required when not running interactively")
+        project_dir = input("Enter project directory path: ").strip()
+        print()
     
     if not os.path.isdir(project_dir):
         print(f"❌ Directory '{project_dir}' not found. Exiting.")
         sys.exit(1)
     
     # Select data snapshot
+    snapshot = settings.get('snapshot', 'snapshot-1')
     deliveries = os.path.join(project_dir, 'deliveries')
-    if os.path.exists(deliveries):
+    if 'snapshot' not in settings and interactive and os.path.exists(deliveries):
         snapshots = [d for d in os.listdir(deliveries) 
                     if os.path.isdir(os.path.join(deliveries, d))]
         
@@ -413,27 +1343,29 @@ def main():
         print()
         
         snap_choice = input("Select snapshot (or press Enter for default): ").strip()
-        snapshot = (snapshots[int(snap_choice)-1] 
-                   if snap_choice.isdigit() and 1 <= int(snap_choice) <= len(snapshots) 
-                   else 'snapshot-1')
-    else:
-        snapshot = 'snapshot-1'
-    
-    print()
+        if snap_choice.isdigit() and 1 <= int(snap_choice) <= len(snapshots):
+            snapshot = snapshots[int(snap_choice)-1]
+        print()
     
     # Get application name
-    app_name = input("Enter application name: ").strip()
-    print()
+    app_name = settings.get('app_name')
+    if app_name is None:
+        app_name = input("Enter application name: ").strip() if interactive else ''
+        print()
     
     # Select execution mode
-    print("Execution Modes:")
-    print("  1. Analysis Only")
-    print("  2. Transform and Build")
-    print("  3. Full Pipeline (Analysis + Transform + Build)")
-    print("  4. Exit")
-    print()
-    
-    mode = input("Select mode: ").strip()
+    mode = settings.get('mode')
+    if not mode:
+        if not interactive:
+            parser.error("--mode is required when not running interactively")
+        print("Execution Modes:")
+        print("  1. Analysis Only")
+        print("  2. Transform and Build")
+        print("  3. Full Pipeline (Analysis + Transform + Build)")
+        print("  4. Exit")
+        print()
+        
+        mode = input("Select mode: ").strip()
     
     if mode == '4':
         print("Exiting.")
@@ -447,84 +1379,38 @@ def main():
     
     print(f"\n✓ Selected: {mode_names.get(mode, 'Unknown')}\n")
     
-    # Set environment variables
-    os.environ['DELIVERY_DIR'] = f"deliveries/{snapshot}"
-    os.environ['SNAPSHOT_NAME'] = snapshot
-    os.environ['APP_NAME'] = app_name
-    
     # Initialize orchestrator
-    orchestrator = PipelineOrchestrator(project_dir)
+    orchestrator = PipelineOrchestrator(project_dir,
+                                        reuse_interpreters=args.reuse_interpreters,
+                                        use_cache=not args.no_cache,
+                                        stream_logs=args.stream_logs)
     
     # Clean logs directory
-    if os.path.exists(orchestrator.log_dir):
-        shutil.rmtree(orchestrator.log_dir)
-    os.makedirs(orchestrator.log_dir, exist_ok=True)
+    _reset_log_dir(orchestrator.log_dir)
     
-    # Execute based on selected mode
-    start_time = time.time()
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     
     try:
-        if mode in ('1', '3'):
-            # Analysis workflow
-            file_types = ['source-files', 'config-files', 'data-files', 'metadata']
-            if not orchestrator.extract_phase(file_types):
-                sys.exit(1)
-            
-            validate_types = ['source-files', 'config-files', 'data-files']
-            if not orchestrator.validate_phase(validate_types):
-                sys.exit(1)
-            
-            analysis_types = ['dependencies', 'patterns', 'metrics', 'quality']
-            if not orchestrator.analyze_phase(analysis_types):
-                sys.exit(1)
-            
-            if mode == '1':
-                print("✓ Analysis complete.")
-                elapsed = time.time() - start_time
-                print(f"\nTotal execution time: {elapsed:.2f} seconds")
-                return
-        
-        if mode in ('2', '3'):
-            # Transform and build workflow
-            if mode == '2':
-                # Need to run extract and validate for mode 2
-                file_types = ['source-files', 'config-files', 'data-files', 'metadata']
-                if not orchestrator.extract_phase(file_types):
-                    sys.exit(1)
-                
-                validate_types = ['source-files', 'config-files', 'data-files']
-                if not orchestrator.validate_phase(validate_types):
-                    sys.exit(1)
-            
-            # Transformation phase
-            transformations = [
-                ('source-files', 'target-format'),
-                ('config-files', 'target-config'),
-                ('data-files', 'target-schema')
-            ]
-            if not orchestrator.transform_phase(transformations):
-                sys.exit(1)
-            
-            # Build phase
-            build_success, metrics = orchestrator.build_phase(build_tool='ant')
-            
-            # Print metrics
-            orchestrator.print_final_metrics(metrics)
-            
-            if build_success:
-                print("✓ Pipeline completed successfully")
-            else:
-                print("⚠ Pipeline completed with warnings")
-        
-        elapsed = time.time() - start_time
-        print(f"Total execution time: {elapsed:.2f} seconds\n")
-        
+        exit_code = asyncio.run(orchestrator.run(
+            mode, snapshot=snapshot, app_name=app_name,
+            build_tool=settings.get('build_tool', 'ant'),
+            file_types=settings.get('file_types'),
+            validate_types=settings.get('validate_types'),
+            analysis_types=settings.get('analysis_types'),
+            transformations=settings.get('transformations')
+        ))
     except KeyboardInterrupt:
         print("\n\n⚠ Pipeline interrupted by user.")
         sys.exit(1)
     except Exception as e:
         print(f"\n❌ Pipeline failed with error: {e}")
         sys.exit(1)
+    finally:
+        orchestrator.close()
+    
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == '__main__':
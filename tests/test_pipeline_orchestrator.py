@@ -0,0 +1,204 @@
+"""
+Tests for the input cache, the stage pipeline and configuration handling.
+
+Each test builds a throwaway project whose pipeline tools record their runs
+in work/runs.txt; TOOL_RC_<tool> and TOOL_SLEEP_<tool> environment variables
+(dashes as underscores) control a tool's exit code and duration.
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pipeline_orchestrator
+from pipeline_orchestrator import PipelineOrchestrator
+
+TOOL_SCRIPT = """\
+import os, sys, time
+name = os.path.splitext(os.path.basename(__file__))[0]
+key = name.replace('-', '_')
+with open(os.path.join('work', 'runs.txt'), 'a') as f:
+    f.write(name + '\\n')
+time.sleep(float(os.environ.get('TOOL_SLEEP_' + key, '0')))
+sys.exit(int(os.environ.get('TOOL_RC_' + key, '0')))
+"""
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ProjectTestCase(unittest.TestCase):
+    """Base class providing a temporary project with recording tools."""
+
+    TOOLS = ['extract-a', 'extract-b', 'extract-slow', 'validate-a', 'validate-b',
+             'validate-c', 'analyze-x']
+
+    def setUp(self):
+        self.project_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.project_dir, True)
+
+        tools_dir = os.path.join(self.project_dir, 'tools', 'pipeline')
+        os.makedirs(tools_dir)
+        for tool in self.TOOLS:
+            with open(os.path.join(tools_dir, f"{tool}.py"), 'w') as f:
+                f.write(TOOL_SCRIPT)
+
+        self.snapshot_dir = os.path.join(self.project_dir, 'deliveries', 'snapshot-1')
+        os.makedirs(self.snapshot_dir)
+        with open(os.path.join(self.snapshot_dir, 'input.txt'), 'w') as f:
+            f.write('data')
+        os.makedirs(os.path.join(self.project_dir, 'work'))
+
+        env = mock.patch.dict(os.environ, {'DELIVERY_DIR': 'deliveries/snapshot-1'})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def orchestrator(self, **kwargs) -> PipelineOrchestrator:
+        """Create an orchestrator logging into the temporary project."""
+        orchestrator = PipelineOrchestrator(
+            self.project_dir, log_dir=os.path.join(self.project_dir, 'runlogs'), **kwargs
+        )
+        self.addCleanup(orchestrator.close)
+        return orchestrator
+
+    def runs(self) -> list:
+        """Tools run so far, in completion order, and reset the record."""
+        path = os.path.join(self.project_dir, 'work', 'runs.txt')
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            runs = f.read().split()
+        os.remove(path)
+        return runs
+
+    def quietly(self, coro):
+        """Run a coroutine to completion with console output suppressed."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            return asyncio.run(coro)
+
+
+class TestInputCache(ProjectTestCase):
+
+    def test_unchanged_inputs_skip_tools(self):
+        self.assertTrue(self.quietly(self.orchestrator().extract_phase(['a'])))
+        self.assertEqual(self.runs(), ['extract-a'])
+
+        self.assertTrue(self.quietly(self.orchestrator().extract_phase(['a'])))
+        self.assertEqual(self.runs(), [])
+
+    def test_uncached_failure_invalidates_stamp(self):
+        self.quietly(self.orchestrator().extract_phase(['a']))
+        self.runs()
+
+        with mock.patch.dict(os.environ, {'TOOL_RC_extract_a': '2'}):
+            self.assertFalse(self.quietly(self.orchestrator(use_cache=False).extract_phase(['a'])))
+        self.runs()
+
+        self.assertTrue(self.quietly(self.orchestrator().extract_phase(['a'])))
+        self.assertEqual(self.runs(), ['extract-a'])
+
+    def test_extraction_rerun_invalidates_validation(self):
+        self.quietly(self.orchestrator().run_pipeline(['a'], ['a'], []))
+        self.assertEqual(self.runs(), ['extract-a', 'validate-a'])
+
+        self.quietly(self.orchestrator(use_cache=False).extract_phase(['a']))
+        self.runs()
+
+        # Uncached runs leave no stamp, so extraction repeats too
+        self.quietly(self.orchestrator().run_pipeline(['a'], ['a'], []))
+        self.assertEqual(self.runs(), ['extract-a', 'validate-a'])
+
+    def test_renamed_input_invalidates_stamp(self):
+        self.quietly(self.orchestrator().extract_phase(['a']))
+        self.runs()
+
+        os.rename(os.path.join(self.snapshot_dir, 'input.txt'),
+                  os.path.join(self.snapshot_dir, 'renamed.txt'))
+
+        self.quietly(self.orchestrator().extract_phase(['a']))
+        self.assertEqual(self.runs(), ['extract-a'])
+
+    @unittest.skipIf(sys.platform == 'win32', "symlinks need privileges on Windows")
+    def test_dangling_symlink_in_inputs(self):
+        os.symlink(os.path.join(self.snapshot_dir, 'missing'),
+                   os.path.join(self.snapshot_dir, 'dangling'))
+
+        self.assertTrue(self.quietly(self.orchestrator().extract_phase(['a'])))
+        self.assertEqual(self.runs(), ['extract-a'])
+
+
+class TestStagePipeline(ProjectTestCase):
+
+    def test_validate_only_types_run(self):
+        orchestrator = self.orchestrator(use_cache=False)
+        self.assertTrue(self.quietly(orchestrator.run_pipeline(['a'], ['a', 'c'], [])))
+        self.assertEqual(sorted(self.runs()), ['extract-a', 'validate-a', 'validate-c'])
+
+    def test_failure_stops_running_tools(self):
+        orchestrator = self.orchestrator(use_cache=False)
+        with mock.patch.dict(os.environ, {'TOOL_SLEEP_extract_slow': '30',
+                                          'TOOL_SLEEP_extract_a': '0.5',
+                                          'TOOL_RC_extract_a': '1'}):
+            start = time.monotonic()
+            self.assertFalse(self.quietly(
+                orchestrator.run_pipeline(['slow', 'a'], ['a'], ['x'])
+            ))
+        self.assertLess(time.monotonic() - start, 15)
+        self.assertNotIn('analyze-x', self.runs())
+
+    def test_summaries_follow_input_order(self):
+        orchestrator = self.orchestrator(use_cache=False)
+        with mock.patch.dict(os.environ, {'TOOL_SLEEP_extract_a': '0.5'}):
+            self.quietly(orchestrator.run_pipeline(['a', 'b'], ['a', 'b'], ['x']))
+
+        self.assertEqual(orchestrator.execution_summary['extract'], ['a', 'b'])
+        self.assertEqual(orchestrator.execution_summary['validate'], ['a', 'b'])
+        self.assertEqual(orchestrator.execution_summary['analyze'], ['x'])
+
+
+class TestConfiguration(unittest.TestCase):
+
+    @unittest.skipIf(pipeline_orchestrator.yaml is None, "PyYAML not installed")
+    def test_sample_config_settings(self):
+        config = pipeline_orchestrator.load_config(os.path.join(REPO_DIR, 'pipeline_config.yaml'))
+        settings = pipeline_orchestrator._settings_from_config(config)
+
+        self.assertEqual(settings['snapshot'], 'snapshot-1')
+        self.assertEqual(settings['build_tool'], 'ant')
+        self.assertEqual(settings['file_types'], pipeline_orchestrator.DEFAULT_FILE_TYPES)
+        self.assertEqual(settings['transformations'],
+                         pipeline_orchestrator.DEFAULT_TRANSFORMATIONS)
+
+    def main_exit_code(self, *argv: str) -> int:
+        """Run main() non-interactively and return its exit status."""
+        with mock.patch.object(sys, 'argv', ['pipeline_orchestrator.py', *argv]), \
+                mock.patch.object(sys.stdin, 'isatty', return_value=False), \
+                contextlib.redirect_stdout(io.StringIO()), \
+                contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit) as raised:
+                pipeline_orchestrator.main()
+        return raised.exception.code
+
+    @unittest.skipIf(pipeline_orchestrator.yaml is None, "PyYAML not installed")
+    def test_invalid_config_mode_is_rejected(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.yaml', delete=False) as f:
+            f.write("project_dir: .\nmode: 5\n")
+        self.addCleanup(os.remove, f.name)
+
+        self.assertEqual(self.main_exit_code('--config', f.name), 2)
+
+    def test_missing_settings_without_terminal(self):
+        self.assertEqual(self.main_exit_code('--mode', '1'), 2)
+        self.assertEqual(self.main_exit_code('--project-dir', REPO_DIR), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()